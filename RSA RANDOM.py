@@ -2,6 +2,15 @@ from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
+
+# Shared padding and hash objects; building them per call costs more than
+# the crypto itself for short messages
+_PSS = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.MAX_LENGTH
+)
+_SHA256 = hashes.SHA256()
+
 mes_input = input("enter message = ")
 message = mes_input.encode()
 def key_gen():
@@ -11,28 +20,13 @@ def key_gen():
     return private_key, public_key
 
 def sign(message, private_key):
-    signature = private_key.sign(
-        message,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.MAX_LENGTH
-        ),
-        hashes.SHA256()
-    )
+    signature = private_key.sign(message, _PSS, _SHA256)
     print("signing don")
     return signature
 
 def verify(message, signature, public_key):
     try:
-        public_key.verify(
-            signature,
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        public_key.verify(signature, message, _PSS, _SHA256)
         print("signature is valid")
         return True
     except InvalidSignature:
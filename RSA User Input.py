@@ -3,13 +3,23 @@ from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateNumbers, RSAPublicNumbers
-import sympy
+from math import gcd
+from elgamal import is_prime
+
+# Shared padding and hash objects; building them per call costs more than
+# the crypto itself for short messages
+_PSS = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.MAX_LENGTH
+)
+_SHA256 = hashes.SHA256()
+
 mas_input = input("enter message = ")
 message = mas_input.encode()
 p = int(input("enter prime number p = "))
 q = int(input("enter prime number q = "))
 
-if not sympy.isprime(p) or not sympy.isprime(q):
+if not is_prime(p) or not is_prime(q):
     print("Both p and q must be prime numbers!")
     exit()
 
@@ -17,7 +27,7 @@ n = p * q
 phi = (p - 1) * (q - 1)
 e = 65537
 
-if sympy.gcd(e, phi) != 1:
+if gcd(e, phi) != 1:
     print("e and phi(n) are not coprime")
     exit()
 d = pow(e, -1, phi)
@@ -42,28 +52,13 @@ print("private exponent d =", d)
 print("public exponent e =", e)
 
 def sign(message, private_key):
-    signature = private_key.sign(
-        message,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.MAX_LENGTH
-        ),
-        hashes.SHA256()
-    )
+    signature = private_key.sign(message, _PSS, _SHA256)
     print("Signing done")
     return signature
 
 def verify(message, signature, public_key):
     try:
-        public_key.verify(
-            signature,
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        public_key.verify(signature, message, _PSS, _SHA256)
         print("Signature is valid")
         return True
     except InvalidSignature:
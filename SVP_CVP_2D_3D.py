@@ -1,42 +1,35 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.spatial import cKDTree
 from matplotlib.widgets import Slider, RadioButtons
 from matplotlib.patches import Polygon
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 
 class LatticeVisualizer:
+    SHORT_COLORS = ['#ff69b4', '#ffa500', '#ffff99', '#90ee90', '#ff4040']
+    SHORT_LABELS = ['Short Vector 1', 'Short Vector 2', 'Short Vector 3', 'Short Vector 4', 'Short Vector 5']
+
     def __init__(self, problem='CVP', dimension='2D'):
         # Initialize plot
         plt.style.use('dark_background')
         self.fig = plt.figure(figsize=(12, 12))
         plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.25)
         self.fig.patch.set_facecolor('#1e1e1e')
-        
-        # Initialize axes
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self._configure(problem, dimension)
+
+        # Setup mode selector
+        self.ax_mode = plt.axes([0.75, 0.85, 0.15, 0.1], facecolor='#4a4a4a')
+        self.mode_selector = RadioButtons(self.ax_mode, ['CVP 2D', 'CVP 3D', 'SVP 2D', 'SVP 3D'], active=0)
+        self.mode_selector.on_clicked(self.change_mode)
+
+    def _configure(self, problem, dimension):
+        """Set up the axes, state and widgets for one problem/dimension mode."""
+        self.problem = problem
         self.dimension = dimension
-        if dimension == '3D':
-            self.ax = self.fig.add_subplot(111, projection='3d')
-            self.ax.set_facecolor('#2a2a2a')
-            self.ax.xaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
-            self.ax.yaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
-            self.ax.zaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
-            self.ax.set_zlabel('Z-axis', fontsize=12, color='white')
-        else:
-            self.ax = self.fig.add_subplot(111)
-            self.ax.set_facecolor('#2a2a2a')
-            self.ax.axhline(0, color='gray', lw=0.5, alpha=0.5)
-            self.ax.axvline(0, color='gray', lw=0.5, alpha=0.5)
-        
-        self.ax.grid(True, linestyle='--', alpha=0.5, color='lightgray')
-        self.ax.set_xlabel('X-axis', fontsize=12, color='white')
-        self.ax.set_ylabel('Y-axis', fontsize=12, color='white')
-        self.ax.tick_params(colors='white')
-        self.ax.set_xlim(-15, 15)
-        self.ax.set_ylim(-15, 15)
-        if dimension == '3D':
-            self.ax.set_zlim(-10, 10)
-        
+
         # Initialize basis vectors and target
         self.b1 = np.array([4.0, 1.0, 0.0] if dimension == '3D' else [4.0, 1.0])
         self.b2 = np.array([1.0, 3.0, 0.0] if dimension == '3D' else [1.0, 3.0])
@@ -44,8 +37,17 @@ class LatticeVisualizer:
         self.target = np.array([2.5, 1.5, 1.0] if dimension == '3D' else [2.5, 1.5])
         self.a_range = 3 if dimension == '3D' else 5
         self.b_range = self.a_range
-        self.problem = problem
-        
+
+        # Lattice points and nearest-neighbor tree, cached across target-only
+        # updates and rebuilt only when a basis or range slider moves
+        self._lattice_points = None
+        self._lattice_dirty = True
+        self._tree = None
+
+        # Memoized query results, invalidated whenever the lattice is rebuilt
+        self._closest_cache = None
+        self._short_cache = None
+
         # Plot elements
         self.scatter = None
         self.target_scatter = None
@@ -59,43 +61,127 @@ class LatticeVisualizer:
         self.closest_annotation = None
         self.target_annotation = None
         self.short_annotations = []
-        
-        # Setup sliders
+
+        # Blitting state: cached static background and the artists redrawn
+        # on top of it (2D only -- 3D axes do not blit cleanly)
+        self._background = None
+        self._legend = None
+        self._legend_labels = None
+        self._dynamic_artists = []
+
+        # Setup axes, artists and sliders
+        self._build_axes()
+        self._build_artists()
         self.setup_sliders()
         self.update_plot()
-        
-        # Setup mode selector
-        self.ax_mode = plt.axes([0.75, 0.85, 0.15, 0.1], facecolor='#4a4a4a')
-        self.mode_selector = RadioButtons(self.ax_mode, ['CVP 2D', 'CVP 3D', 'SVP 2D', 'SVP 3D'], active=0)
-        self.mode_selector.on_clicked(self.change_mode)
-    
+
+    def _build_axes(self):
+        if self.dimension == '3D':
+            self.ax = self.fig.add_subplot(111, projection='3d')
+            self.ax.set_facecolor('#2a2a2a')
+            self.ax.xaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
+            self.ax.yaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
+            self.ax.zaxis.set_pane_color((0.16, 0.16, 0.16, 1.0))
+            self.ax.set_zlabel('Z-axis', fontsize=12, color='white')
+        else:
+            self.ax = self.fig.add_subplot(111)
+            self.ax.set_facecolor('#2a2a2a')
+            self.ax.axhline(0, color='gray', lw=0.5, alpha=0.5)
+            self.ax.axvline(0, color='gray', lw=0.5, alpha=0.5)
+
+        self.ax.grid(True, linestyle='--', alpha=0.5, color='lightgray')
+        self.ax.set_xlabel('X-axis', fontsize=12, color='white')
+        self.ax.set_ylabel('Y-axis', fontsize=12, color='white')
+        self.ax.tick_params(colors='white')
+        self.ax.set_xlim(-15, 15)
+        self.ax.set_ylim(-15, 15)
+        if self.dimension == '3D':
+            self.ax.set_zlim(-10, 10)
+
     def generate_lattice(self):
-        lattice_points = []
+        # float32 is plenty for the +-15 plot range and halves the bytes
+        # streamed through the rendering pipeline
+        rng = np.arange(-self.a_range, self.a_range + 1, dtype=np.float32)
         if self.dimension == '3D':
-            for a in range(-self.a_range, self.a_range + 1):
-                for b in range(-self.b_range, self.b_range + 1):
-                    for c in range(-self.a_range, self.a_range + 1):
-                        point = a * self.b1 + b * self.b2 + c * self.b3
-                        lattice_points.append(point)
+            a, b, c = np.meshgrid(rng, rng, rng, indexing='ij')
+            coeffs = np.stack([a.ravel(), b.ravel(), c.ravel()])
+            basis = np.stack([self.b1, self.b2, self.b3], axis=1).astype(np.float32)
         else:
-            for a in range(-self.a_range, self.a_range + 1):
-                for b in range(-self.b_range, self.b_range + 1):
-                    point = a * self.b1 + b * self.b2
-                    lattice_points.append(point)
-        return np.array(lattice_points)
+            a, b = np.meshgrid(rng, rng, indexing='ij')
+            coeffs = np.stack([a.ravel(), b.ravel()])
+            basis = np.stack([self.b1, self.b2], axis=1).astype(np.float32)
+        return (basis @ coeffs).T
     
     def find_closest_vector(self, lattice_points):
-        distances = np.linalg.norm(lattice_points - self.target, axis=1)
-        min_index = np.argmin(distances)
-        return lattice_points[min_index], distances[min_index]
+        key = self.target.tobytes()
+        if self._closest_cache is None or self._closest_cache[0] != key:
+            self._closest_cache = (key, self._tree.query(self.target, k=1))
+        distance, index = self._closest_cache[1]
+        return self._tree.data[index], distance
     
-    def find_short_vectors(self, lattice_points, num_vectors=5):
-        non_zero_vectors = lattice_points[np.any(lattice_points != 0, axis=1)]
-        if len(non_zero_vectors) == 0:
-            return np.array([]), np.array([])
-        lengths = np.linalg.norm(non_zero_vectors, axis=1)
-        sorted_indices = np.argsort(lengths)[:min(num_vectors, len(lengths))]
-        return non_zero_vectors[sorted_indices], lengths[sorted_indices]
+    def _short_vectors_from_tree(self, num_vectors):
+        # A degenerate basis collapses many coefficient tuples onto the same
+        # point, so deduplicate before selecting the nearest non-zero points
+        points = np.unique(self._tree.data, axis=0)
+        sq_lengths = np.einsum('ij,ij->i', points, points)
+        non_zero = sq_lengths > 0
+        points, sq_lengths = points[non_zero], sq_lengths[non_zero]
+        k = min(num_vectors, len(points))
+        if k == 0:
+            return points, sq_lengths
+        part = np.argpartition(sq_lengths, k - 1)[:k]
+        order = part[np.argsort(sq_lengths[part])]
+        return points[order], np.sqrt(sq_lengths[order])
+
+    def _enumerate_in_ball(self, R, bound):
+        """Fincke-Pohst enumeration: integer vectors v != 0 with ||R v|| <= bound (R upper triangular)."""
+        dims = R.shape[0]
+        results = []
+        v = np.zeros(dims, dtype=int)
+
+        def recurse(i, rem_sq):
+            c = float(R[i, i+1:] @ v[i+1:])
+            rem = np.sqrt(max(rem_sq, 0.0))
+            for vi in range(int(np.ceil((-rem - c) / R[i, i])), int(np.floor((rem - c) / R[i, i])) + 1):
+                v[i] = vi
+                if i == 0:
+                    if any(v):
+                        results.append(v.copy())
+                else:
+                    yi = R[i, i] * vi + c
+                    recurse(i - 1, rem_sq - yi * yi)
+            v[i] = 0
+
+        recurse(dims - 1, bound * bound)
+        return np.array(results)
+
+    def find_short_vectors(self, num_vectors=5):
+        # The result depends only on the basis, which also invalidates the cache
+        if self._short_cache is not None:
+            return self._short_cache
+        basis_vectors = [self.b1, self.b2] + ([self.b3] if self.dimension == '3D' else [])
+        basis = np.stack(basis_vectors, axis=1)
+        det = abs(np.linalg.det(basis))
+        if det < 1e-6:
+            # Degenerate basis: fall back to the kd-tree over the rendered lattice
+            return self._short_vectors_from_tree(num_vectors)
+        dims = basis.shape[0]
+        # Minkowski bound: a ball of this radius always contains a shortest vector
+        bound = 1.1 * np.sqrt(dims) * det ** (1.0 / dims)
+        gram = basis.T @ basis
+        R = np.linalg.cholesky(gram).T
+        coeffs = self._enumerate_in_ball(R, bound)
+        while len(coeffs) < num_vectors:
+            bound *= 1.5
+            coeffs = self._enumerate_in_ball(R, bound)
+        vectors = coeffs @ basis.T
+        # Rank by squared length (selection is sqrt-invariant); sqrt only the winners
+        sq_lengths = np.einsum('ij,ij->i', vectors, vectors)
+        k = min(num_vectors, len(sq_lengths))
+        part = np.argpartition(sq_lengths, k - 1)[:k]
+        order = part[np.argsort(sq_lengths[part])]
+        self._short_cache = (vectors[order], np.sqrt(sq_lengths[order]))
+        return self._short_cache
     
     def setup_sliders(self):
         axcolor = '#4a4a4a'
@@ -182,154 +268,205 @@ class LatticeVisualizer:
                 s_tz.label.set_color(slider_label_color)
                 self.sliders.append(s_tz)
         
-        for slider in self.sliders:
-            slider.on_changed(self.update)
+        for i, slider in enumerate(self.sliders):
+            slider.on_changed(lambda val, index=i: self.update(index, val))
     
-    def update_plot(self):
-        # Clear previous elements
-        if self.scatter:
-            self.scatter.remove()
-        if self.target_scatter:
-            self.target_scatter.remove()
-        if self.b1_quiver:
-            self.b1_quiver.remove()
-        if self.b2_quiver:
-            self.b2_quiver.remove()
-        if self.b3_quiver:
-            self.b3_quiver.remove()
-        if self.patch:
-            self.patch.remove()
-        if self.closest_quiver:
-            self.closest_quiver.remove()
-        if self.residual_quiver:
-            self.residual_quiver.remove()
-        for quiver in self.short_quivers:
-            quiver.remove()
-        self.short_quivers.clear()
-        if self.closest_annotation:
-            self.closest_annotation.remove()
-        if self.target_annotation:
-            self.target_annotation.remove()
-        for annot in self.short_annotations:
-            annot.remove()
-        self.short_annotations.clear()
-        
-        # Generate lattice points
-        lattice_points = self.generate_lattice()
-        
-        # Plot lattice points
+    def _build_artists(self):
+        # Create every artist once; update_plot mutates them in place.
+        # 3D quivers are the exception: matplotlib offers no in-place update
+        # for them, so they are recreated on each refresh.
         if self.dimension == '3D':
-            self.scatter = self.ax.scatter3D(lattice_points[:, 0], lattice_points[:, 1], lattice_points[:, 2],
-                                            c='SlateGray', s=40, alpha=0.7, label='Lattice Points')
+            self.scatter = self.ax.scatter3D([], [], [], c='SlateGray', s=40, alpha=0.7, label='Lattice Points')
+            self.patch = Poly3DCollection([[(0, 0, 0)]], alpha=0.3, color='purple', label='Fundamental Domain')
+            self.ax.add_collection3d(self.patch)
         else:
-            self.scatter = self.ax.scatter(lattice_points[:, 0], lattice_points[:, 1],
-                                          c='SlateGray', s=60, alpha=0.7, label='Lattice Points')
-        
-        # Plot basis vectors
+            self.scatter = self.ax.scatter([], [], c='SlateGray', s=60, alpha=0.7, label='Lattice Points')
+            self.b1_quiver = self.ax.quiver(0, 0, self.b1[0], self.b1[1],
+                                           angles='xy', scale_units='xy', scale=1, color='chartreuse')
+            self.b2_quiver = self.ax.quiver(0, 0, self.b2[0], self.b2[1],
+                                           angles='xy', scale_units='xy', scale=1, color='cyan')
+            self.patch = Polygon(np.zeros((4, 2)), closed=True, fill=True, alpha=0.3,
+                                 color='purple', label='Fundamental Domain')
+            self.ax.add_patch(self.patch)
+
+        if self.problem == 'CVP':
+            if self.dimension == '3D':
+                self.target_scatter = self.ax.scatter3D([], [], [], c='red', s=100, marker='*', label='Target Point')
+                self.closest_annotation = self.ax.text(0, 0, 0, '', color='yellow', fontsize=10,
+                                                       zorder=15, ha='right', va='bottom')
+                self.target_annotation = self.ax.text(0, 0, 0, '', color='red', fontsize=10,
+                                                      zorder=15, ha='right', va='bottom')
+            else:
+                self.target_scatter = self.ax.scatter([], [], c='red', s=100, marker='*', label='Target Point')
+                self.closest_quiver = self.ax.quiver(0, 0, 0, 0,
+                                                    angles='xy', scale_units='xy', scale=1, color='yellow')
+                self.residual_quiver = self.ax.quiver(0, 0, 0, 0,
+                                                     angles='xy', scale_units='xy', scale=1,
+                                                     color='orange', label='Residual Vector')
+                self.closest_annotation = self.ax.annotate('', xy=(0, 0), xytext=(-30, 10),
+                                                          textcoords='offset points', color='yellow',
+                                                          fontsize=10, zorder=15)
+                self.target_annotation = self.ax.annotate('', xy=(0, 0), xytext=(-30, 10),
+                                                         textcoords='offset points', color='red',
+                                                         fontsize=10, zorder=15)
+        else:  # SVP
+            for i, color in enumerate(self.SHORT_COLORS):
+                if self.dimension == '3D':
+                    annot = self.ax.text(0, 0, 0, '', color=color, fontsize=10,
+                                        zorder=15, ha='right', va='bottom')
+                else:
+                    quiver = self.ax.quiver(0, 0, 0, 0,
+                                           angles='xy', scale_units='xy', scale=1,
+                                           color=color, zorder=10 if i == 4 else 5)
+                    self.short_quivers.append(quiver)
+                    annot = self.ax.annotate('', xy=(0, 0), xytext=(-30, 10),
+                                            textcoords='offset points', color=color,
+                                            fontsize=10, zorder=15)
+                self.short_annotations.append(annot)
+
+        if self.dimension == '2D':
+            self._dynamic_artists = [self.scatter, self.b1_quiver, self.b2_quiver, self.patch]
+            if self.problem == 'CVP':
+                self._dynamic_artists += [self.target_scatter, self.closest_quiver, self.residual_quiver,
+                                          self.closest_annotation, self.target_annotation]
+            else:
+                self._dynamic_artists += self.short_quivers + self.short_annotations
+            for artist in self._dynamic_artists:
+                artist.set_animated(True)
+
+    def _on_draw(self, event):
+        # A full draw just happened: snapshot the static background and put
+        # the animated artists back on top of it (2D only)
+        if self.dimension != '2D':
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_dynamic_artists()
+
+    def _draw_dynamic_artists(self):
+        for artist in self._dynamic_artists:
+            self.ax.draw_artist(artist)
+        if self._legend is not None:
+            self.ax.draw_artist(self._legend)
+
+    def update_plot(self):
+        # Regenerate lattice points only when the basis or range changed
+        if self._lattice_dirty or self._lattice_points is None:
+            self._lattice_points = self.generate_lattice()
+            self._tree = cKDTree(self._lattice_points)
+            self._lattice_dirty = False
+            self._closest_cache = None
+            self._short_cache = None
+        lattice_points = self._lattice_points
+
+        # Update lattice points and basis vectors in place
         if self.dimension == '3D':
+            self.scatter._offsets3d = (lattice_points[:, 0], lattice_points[:, 1], lattice_points[:, 2])
+            for quiver in (self.b1_quiver, self.b2_quiver, self.b3_quiver):
+                if quiver:
+                    quiver.remove()
             self.b1_quiver = self.ax.quiver3D(0, 0, 0, self.b1[0], self.b1[1], self.b1[2],
                                              length=1, color='chartreuse', label=f'b1 = ({self.b1[0]:.1f}, {self.b1[1]:.1f}, {self.b1[2]:.1f})')
             self.b2_quiver = self.ax.quiver3D(0, 0, 0, self.b2[0], self.b2[1], self.b2[2],
                                              length=1, color='cyan', label=f'b2 = ({self.b2[0]:.1f}, {self.b2[1]:.1f}, {self.b2[2]:.1f})')
             self.b3_quiver = self.ax.quiver3D(0, 0, 0, self.b3[0], self.b3[1], self.b3[2],
                                              length=1, color='magenta', label=f'b3 = ({self.b3[0]:.1f}, {self.b3[1]:.1f}, {self.b3[2]:.1f})')
-        else:
-            self.b1_quiver = self.ax.quiver(0, 0, self.b1[0], self.b1[1],
-                                           angles='xy', scale_units='xy', scale=1,
-                                           color='chartreuse', label=f'b1 = ({self.b1[0]:.1f}, {self.b1[1]:.1f})')
-            self.b2_quiver = self.ax.quiver(0, 0, self.b2[0], self.b2[1],
-                                           angles='xy', scale_units='xy', scale=1,
-                                           color='cyan', label=f'b2 = ({self.b2[0]:.1f}, {self.b2[1]:.1f})')
-        
-        # Plot fundamental domain
-        if self.dimension == '3D':
             verts = [list(zip([0, self.b1[0], self.b1[0]+self.b2[0], self.b2[0], 0],
                               [0, self.b1[1], self.b1[1]+self.b2[1], self.b2[1], 0],
                               [0, self.b1[2], self.b1[2]+self.b2[2], self.b2[2], 0])),
                      list(zip([0, 0, self.b3[0], self.b3[0], 0],
                               [0, self.b2[1], self.b2[1]+self.b3[1], self.b3[1], 0],
                               [0, self.b2[2], self.b2[2]+self.b3[2], self.b3[2], 0]))]
-            self.patch = Poly3DCollection(verts, alpha=0.3, color='purple', label='Fundamental Domain')
-            self.ax.add_collection3d(self.patch)
+            self.patch.set_verts(verts)
         else:
-            parallelogram = np.array([[0, 0], self.b1, self.b1 + self.b2, self.b2])
-            self.patch = Polygon(parallelogram, closed=True, fill=True, alpha=0.3,
-                                 color='purple', label='Fundamental Domain')
-            self.ax.add_patch(self.patch)
-        
-        # Plot problem-specific elements
+            self.scatter.set_offsets(lattice_points)
+            self.b1_quiver.set_UVC(self.b1[0], self.b1[1])
+            self.b1_quiver.set_label(f'b1 = ({self.b1[0]:.1f}, {self.b1[1]:.1f})')
+            self.b2_quiver.set_UVC(self.b2[0], self.b2[1])
+            self.b2_quiver.set_label(f'b2 = ({self.b2[0]:.1f}, {self.b2[1]:.1f})')
+            self.patch.set_xy(np.array([[0, 0], self.b1, self.b1 + self.b2, self.b2]))
+
+        # Update problem-specific elements
         if self.problem == 'CVP':
-            # Plot target point
-            if self.dimension == '3D':
-                self.target_scatter = self.ax.scatter3D(self.target[0], self.target[1], self.target[2],
-                                                       c='red', s=100, marker='*', label='Target Point')
-            else:
-                self.target_scatter = self.ax.scatter(self.target[0], self.target[1],
-                                                     c='red', s=100, marker='*', label='Target Point')
-            
-            # Find and plot closest vector
             closest_point, closest_distance = self.find_closest_vector(lattice_points)
             if self.dimension == '3D':
+                self.target_scatter._offsets3d = ([self.target[0]], [self.target[1]], [self.target[2]])
+                for quiver in (self.closest_quiver, self.residual_quiver):
+                    if quiver:
+                        quiver.remove()
                 self.closest_quiver = self.ax.quiver3D(0, 0, 0, closest_point[0], closest_point[1], closest_point[2],
                                                       length=1, color='yellow', label=f'Closest Point (dist={closest_distance:.2f})')
                 self.residual_quiver = self.ax.quiver3D(closest_point[0], closest_point[1], closest_point[2],
                                                        self.target[0] - closest_point[0], self.target[1] - closest_point[1], self.target[2] - closest_point[2],
                                                        length=1, color='orange', label='Residual Vector')
-                self.closest_annotation = self.ax.text(closest_point[0], closest_point[1], closest_point[2],
-                                                     f'Closest: ({closest_point[0]:.0f}, {closest_point[1]:.0f}, {closest_point[2]:.0f})\ndist={closest_distance:.2f}',
-                                                     color='yellow', fontsize=10, zorder=15, ha='right', va='bottom')
-                self.target_annotation = self.ax.text(self.target[0], self.target[1], self.target[2],
-                                                    f'Target: ({self.target[0]:.1f}, {self.target[1]:.1f}, {self.target[2]:.1f})',
-                                                    color='red', fontsize=10, zorder=15, ha='right', va='bottom')
+                self.closest_annotation.set_position_3d(closest_point)
+                self.closest_annotation.set_text(f'Closest: ({closest_point[0]:.0f}, {closest_point[1]:.0f}, {closest_point[2]:.0f})\ndist={closest_distance:.2f}')
+                self.target_annotation.set_position_3d(self.target)
+                self.target_annotation.set_text(f'Target: ({self.target[0]:.1f}, {self.target[1]:.1f}, {self.target[2]:.1f})')
             else:
-                self.closest_quiver = self.ax.quiver(0, 0, closest_point[0], closest_point[1],
-                                                    angles='xy', scale_units='xy', scale=1,
-                                                    color='yellow', label=f'Closest Point (dist={closest_distance:.2f})')
-                self.residual_quiver = self.ax.quiver(closest_point[0], closest_point[1],
-                                                     self.target[0] - closest_point[0], self.target[1] - closest_point[1],
-                                                     angles='xy', scale_units='xy', scale=1,
-                                                     color='orange', label='Residual Vector')
-                self.closest_annotation = self.ax.annotate(f'Closest: ({closest_point[0]:.0f}, {closest_point[1]:.0f})\ndist={closest_distance:.2f}',
-                                                          xy=closest_point, xytext=(-30, 10),
-                                                          textcoords='offset points', color='yellow',
-                                                          fontsize=10, zorder=15)
-                self.target_annotation = self.ax.annotate(f'Target: ({self.target[0]:.1f}, {self.target[1]:.1f})',
-                                                         xy=self.target, xytext=(-30, 10),
-                                                         textcoords='offset points', color='red',
-                                                         fontsize=10, zorder=15)
+                self.target_scatter.set_offsets([self.target])
+                self.closest_quiver.set_UVC(closest_point[0], closest_point[1])
+                self.closest_quiver.set_label(f'Closest Point (dist={closest_distance:.2f})')
+                self.residual_quiver.set_offsets([closest_point])
+                self.residual_quiver.set_UVC(self.target[0] - closest_point[0], self.target[1] - closest_point[1])
+                self.closest_annotation.xy = tuple(closest_point)
+                self.closest_annotation.set_text(f'Closest: ({closest_point[0]:.0f}, {closest_point[1]:.0f})\ndist={closest_distance:.2f}')
+                self.target_annotation.xy = tuple(self.target)
+                self.target_annotation.set_text(f'Target: ({self.target[0]:.1f}, {self.target[1]:.1f})')
         else:  # SVP
-            short_vectors, short_lengths = self.find_short_vectors(lattice_points)
-            colors = ['#ff69b4', '#ffa500', '#ffff99', '#90ee90', '#ff4040']
-            labels = ['Short Vector 1', 'Short Vector 2', 'Short Vector 3', 'Short Vector 4', 'Short Vector 5']
-            for i, (vec, length, color, label) in enumerate(zip(short_vectors, short_lengths, colors, labels)):
-                if self.dimension == '3D':
+            short_vectors, short_lengths = self.find_short_vectors()
+            if self.dimension == '3D':
+                for quiver in self.short_quivers:
+                    quiver.remove()
+                self.short_quivers.clear()
+                for annot in self.short_annotations:
+                    annot.set_text('')
+                for i, (vec, length) in enumerate(zip(short_vectors, short_lengths)):
                     quiver = self.ax.quiver3D(0, 0, 0, vec[0], vec[1], vec[2],
-                                             length=1, color=color, label=f'{label} (len={length:.2f})',
+                                             length=1, color=self.SHORT_COLORS[i],
+                                             label=f'{self.SHORT_LABELS[i]} (len={length:.2f})',
                                              zorder=10 if i == 4 else 5)
-                    annot = self.ax.text(vec[0], vec[1], vec[2],
-                                        f'({vec[0]:.0f}, {vec[1]:.0f}, {vec[2]:.0f})\nlen={length:.2f}',
-                                        color=color, fontsize=10, zorder=15, ha='right', va='bottom')
-                else:
-                    quiver = self.ax.quiver(0, 0, vec[0], vec[1],
-                                           angles='xy', scale_units='xy', scale=1,
-                                           color=color, label=f'{label} (len={length:.2f})',
-                                           zorder=10 if i == 4 else 5)
-                    annot = self.ax.annotate(f'({vec[0]:.0f}, {vec[1]:.0f})\nlen={length:.2f}',
-                                            xy=vec, xytext=(-30, 10),
-                                            textcoords='offset points', color=color,
-                                            fontsize=10, zorder=15)
-                self.short_quivers.append(quiver)
-                self.short_annotations.append(annot)
-        
-        # Update title and legend
+                    self.short_quivers.append(quiver)
+                    self.short_annotations[i].set_position_3d(vec)
+                    self.short_annotations[i].set_text(f'({vec[0]:.0f}, {vec[1]:.0f}, {vec[2]:.0f})\nlen={length:.2f}')
+            else:
+                for i, (quiver, annot) in enumerate(zip(self.short_quivers, self.short_annotations)):
+                    if i < len(short_vectors):
+                        vec, length = short_vectors[i], short_lengths[i]
+                        quiver.set_UVC(vec[0], vec[1])
+                        quiver.set_label(f'{self.SHORT_LABELS[i]} (len={length:.2f})')
+                        annot.xy = tuple(vec)
+                        annot.set_text(f'({vec[0]:.0f}, {vec[1]:.0f})\nlen={length:.2f}')
+                    else:
+                        quiver.set_UVC(0, 0)
+                        quiver.set_label('_nolegend_')
+                        annot.set_text('')
+
+        # Update title; relay out the legend only when its labels changed
         title = f"Interactive {'Closest' if self.problem == 'CVP' else 'Shortest'} Vector Problem ({self.dimension})"
         self.ax.set_title(title, fontsize=14, pad=15, color='white')
-        self.ax.legend(loc='upper left', fontsize=10, labelcolor='white')
+        labels = self.ax.get_legend_handles_labels()[1]
+        if labels != self._legend_labels:
+            self._legend = self.ax.legend(loc='upper left', fontsize=10, labelcolor='white')
+            self._legend_labels = labels
+            if self.dimension == '2D':
+                self._legend.set_animated(True)
         if self.dimension == '2D':
             self.ax.set_aspect('equal')
-        self.fig.canvas.draw_idle()
+
+        # Blit just the changed artists over the cached background when
+        # possible; fall back to a full redraw otherwise
+        if self.dimension == '2D' and self._background is not None:
+            self.fig.canvas.restore_region(self._background)
+            self._draw_dynamic_artists()
+            self.fig.canvas.blit(self.ax.bbox)
+        else:
+            self.fig.canvas.draw_idle()
     
-    def update(self, val):
+    def update(self, index, val):
+        # Target sliders sit at the end of the list; only the others affect the lattice
+        num_target = (3 if self.dimension == '3D' else 2) if self.problem == 'CVP' else 0
+        if index < len(self.sliders) - num_target:
+            self._lattice_dirty = True
         self.a_range = self.b_range = int(self.sliders[0].val)
         self.b1[0] = self.sliders[1].val
         self.b1[1] = self.sliders[2].val
@@ -360,10 +497,15 @@ class LatticeVisualizer:
         self.update_plot()
     
     def change_mode(self, label):
-        self.problem, self.dimension = label.split()
-        plt.close(self.fig)
-        visualizer = LatticeVisualizer(self.problem, self.dimension)
-        plt.show()
+        problem, dimension = label.split()
+        if (problem, dimension) == (self.problem, self.dimension):
+            return
+        # Reuse the figure and window: tear down only the axes and sliders
+        self.ax.remove()
+        for slider in self.sliders:
+            slider.ax.remove()
+        self._configure(problem, dimension)
+        self.fig.canvas.draw_idle()
 
 if __name__ == '__main__':
     visualizer = LatticeVisualizer()
@@ -1,39 +1,68 @@
+import functools
 import random
 import hashlib
+from math import gcd
 
-def is_prime(n):
-    """Check if a number is prime."""
-    if n <= 1:
-        return False
-    if n <= 3:
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    from gmpy2 import mpz, powmod
+    _HAS_GMP = True
+
+    def _powmod(a, b, m):
+        """Modular exponentiation via GMP, noticeably faster for large moduli."""
+        return int(powmod(mpz(a), b, mpz(m)))
+except ImportError:
+    _HAS_GMP = False
+    _powmod = pow
+
+# Trial division by the first 50 primes rejects most composites cheaply
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53,
+                 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113,
+                 127, 131, 137, 139, 149, 151, 157, 163, 167, 173, 179, 181,
+                 191, 193, 197, 199, 211, 223, 227, 229)
+
+# Witness set proven deterministic for all n < 3.3 * 10^24
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def _miller_rabin(n, a):
+    """One Miller-Rabin round: True if n passes for witness a."""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
         return True
-    if n % 2 == 0 or n % 3 == 0:
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def is_prime(n):
+    """Check if a number is prime using deterministic Miller-Rabin."""
+    if n < 2:
         return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
+    for p in _SMALL_PRIMES:
+        if n == p:
+            return True
+        if n % p == 0:
             return False
-        i += 6
-    return True
+    return all(_miller_rabin(n, a) for a in _MR_WITNESSES)
 
 def mod_inverse(a, m):
     """Calculate the modular multiplicative inverse of a modulo m."""
-    g, x, y = extended_gcd(a, m)
-    if g != 1:
+    try:
+        return pow(a, -1, m)
+    except ValueError:
         raise Exception('Modular inverse does not exist')
-    else:
-        return x % m
-
-def extended_gcd(a, b):
-    """Extended Euclidean Algorithm to find gcd(a, b) and coefficients x, y such that ax + by = gcd(a, b)."""
-    if a == 0:
-        return b, 0, 1
-    else:
-        gcd, x1, y1 = extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
-    2   
+
 def generate_keys(p, g, x):
     """
     Generate ElGamal keys.
@@ -42,14 +71,30 @@ def generate_keys(p, g, x):
     x: private key (random number < p)
     Returns: public key y = g^x mod p
     """
-    y = pow(g, x, p)
+    y = _powmod(g, x, p)
     return y
 
+@functools.lru_cache(maxsize=256)
 def hash_message(message):
-    """Hash the message using SHA-256."""
-    hash_obj = hashlib.sha256(message.encode())
-    # Convert the hash to an integer
-    return int(hash_obj.hexdigest(), 16)
+    """Hash the message using SHA-256 and return it as an integer."""
+    # Raw digest straight into an integer; no hex round-trip
+    return int.from_bytes(hashlib.sha256(message.encode()).digest(), 'big')
+
+def generate_k(p):
+    """Pick a random k with 1 < k < p-1 that is relatively prime to p-1."""
+    if _HAS_NUMPY and 4 < p <= 2**63 - 1:
+        # Draw a batch of candidates and filter with the vectorized gcd ufunc;
+        # one batch almost always contains a valid k
+        while True:
+            candidates = np.random.randint(2, p - 1, size=64, dtype=np.int64)
+            valid = np.nonzero(np.gcd(candidates, p - 1) == 1)[0]
+            if valid.size:
+                return int(candidates[valid[0]])
+    # Big-integer (or numpy-less) fallback
+    while True:
+        k = random.randrange(2, p - 1)
+        if gcd(k, p - 1) == 1:
+            return k
 
 def sign_message(message, p, g, x, k):
     """
@@ -65,14 +110,33 @@ def sign_message(message, p, g, x, k):
     h = hash_message(message)
     
     # Calculate r = g^k mod p
-    r = pow(g, k, p)
+    r = _powmod(g, k, p)
     
     # Calculate s = (h - x*r) * k^(-1) mod (p-1)
-    k_inv = mod_inverse(k, p-1)
+    k_inv = pow(k, -1, p-1)
     s = (k_inv * (h - x * r)) % (p-1)
     
     return r, s
 
+def _double_exp(g1, e1, g2, e2, m):
+    """Compute g1^e1 * g2^e2 mod m with Shamir's simultaneous exponentiation.
+
+    One left-to-right scan over the paired bits of e1 and e2 shares the
+    squarings between both exponentiations, roughly halving the work of
+    two separate pow calls.
+    """
+    if _HAS_GMP:
+        # Keep the loop's multiplies and reductions inside GMP
+        g1, g2, m = mpz(g1), mpz(g2), mpz(m)
+    table = {(0, 0): 1, (1, 0): g1 % m, (0, 1): g2 % m, (1, 1): g1 * g2 % m}
+    result = 1
+    for i in range(max(e1.bit_length(), e2.bit_length()) - 1, -1, -1):
+        result = result * result % m
+        bits = ((e1 >> i) & 1, (e2 >> i) & 1)
+        if bits != (0, 0):
+            result = result * table[bits] % m
+    return int(result)
+
 def verify_signature(message, r, s, p, g, y):
     """
     Verify ElGamal signature.
@@ -91,10 +155,10 @@ def verify_signature(message, r, s, p, g, y):
     h = hash_message(message)
     
     # Calculate v1 = g^h mod p
-    v1 = pow(g, h, p)
+    v1 = _powmod(g, h, p)
     
-    # Calculate v2 = y^r * r^s mod p
-    v2 = (pow(y, r, p) * pow(r, s, p)) % p
+    # Calculate v2 = y^r * r^s mod p in a single simultaneous exponentiation
+    v2 = _double_exp(y, r, r, s, p)
     
     return v1 == v2
 
@@ -146,13 +210,18 @@ def main():
     # Get random k for signing
     while True:
         try:
-            k = int(input(f"Enter a random k (1 < k < {p-1} and gcd(k, {p-1}) = 1): "))
+            k_input = input(f"Enter a random k (1 < k < {p-1} and gcd(k, {p-1}) = 1, blank to auto-generate): ")
+            if not k_input.strip():
+                k = generate_k(p)
+                print(f"Generated k = {k}")
+                break
+            k = int(k_input)
             if k <= 1 or k >= p-1:
                 print(f"Error: k must be between 1 and {p-2}. Please try again.")
                 continue
             
             # Check if k is relatively prime to p-1
-            if extended_gcd(k, p-1)[0] != 1:
+            if gcd(k, p-1) != 1:
                 print(f"Error: k must be relatively prime to {p-1}. Please try again.")
                 continue
             
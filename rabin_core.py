@@ -0,0 +1,117 @@
+import functools
+import hashlib
+import secrets
+from dataclasses import dataclass
+import gmpy2
+
+def _odd_primes_below(limit):
+    """Sieve of Eratosthenes returning the odd primes below limit."""
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(range(i * i, limit, i)))
+    return tuple(i for i in range(3, limit, 2) if sieve[i])
+
+# Odd primes for the pre-sieve: most composite candidates are rejected by a
+# residue check against these before the much costlier Miller-Rabin rounds
+SMALL_PRIMES = _odd_primes_below(50000)
+
+# Product of the sieve primes: a single GMP gcd against this screens a
+# candidate for all of them at once
+_SMALL_PRIMORIAL = gmpy2.mpz(1)
+for _small in SMALL_PRIMES:
+    _SMALL_PRIMORIAL *= _small
+del _small
+
+@functools.lru_cache(maxsize=256)
+def hash_message(message):
+    """Hash a str or bytes message with SHA-256 and return an integer."""
+    # Bytes input goes to the hash as-is; only str pays the encode copy
+    data = message.encode('utf-8') if isinstance(message, str) else message
+    # Raw digest straight into an integer; no hex string round-trip
+    return int.from_bytes(hashlib.sha256(data).digest(), 'big')
+
+def generate_prime(bits=512):
+    """Generate a prime number of specified bit length, congruent to 3 mod 4."""
+    # CSPRNG draw with the top bit forced (full bit length) and the low two
+    # bits forced (p = 3 mod 4 from the start)
+    p = gmpy2.mpz(secrets.randbits(bits)) | (1 << (bits - 1)) | 3
+    while True:
+        # One gcd against the primorial rejects candidates with any small
+        # factor. A candidate that is itself a sieve prime shares a factor
+        # with the primorial even though it is prime, so candidates within
+        # the sieve range go straight to Miller-Rabin
+        if ((gmpy2.gcd(p, _SMALL_PRIMORIAL) == 1 or p <= SMALL_PRIMES[-1])
+                and gmpy2.is_prime(p, 25)):
+            return int(p)
+        p += 4
+
+@dataclass
+class RabinPrivateKey:
+    """Rabin private key with the per-key signing constants precomputed."""
+    p: gmpy2.mpz
+    q: gmpy2.mpz
+    n: gmpy2.mpz
+    dp1: gmpy2.mpz   # (p + 1) // 4
+    dq1: gmpy2.mpz   # (q + 1) // 4
+    qinv: gmpy2.mpz  # q^-1 mod p
+    w: gmpy2.mpz     # qinv * q mod n, for the one-reduction CRT recombination
+
+def _make_private_key(p, q):
+    """Bundle p and q with the constants every signature needs.
+
+    Everything is kept as mpz so no per-signature promotion from Python
+    int is needed; gmpy2's powmod already switches to Montgomery form
+    internally, so the exponent and recombination constants are all the
+    precomputation the hot path can use.
+    """
+    p, q = gmpy2.mpz(p), gmpy2.mpz(q)
+    qinv = gmpy2.invert(q, p)
+    return RabinPrivateKey(p=p, q=q, n=p * q,
+                           dp1=(p + 1) // 4, dq1=(q + 1) // 4,
+                           qinv=qinv, w=qinv * q % (p * q))
+
+def key_generation(bits=512):
+    """Generate Rabin key pair."""
+    # The two prime searches are independent, but gmpy2's is_prime holds
+    # the GIL, so threads would serialize them anyway; run them in turn
+    return _make_private_key(generate_prime(bits), generate_prime(bits))
+
+def _sign_hashed(m, key):
+    """Sign an already-hashed-and-reduced message."""
+    # Find square roots modulo p and q; the halves are independent, but
+    # gmpy2's powmod holds the GIL, so threads cannot overlap them and
+    # the submit/result round trip only adds overhead — run them inline
+    r_p = gmpy2.powmod(m, key.dp1, key.p)
+    r_q = gmpy2.powmod(m, key.dq1, key.q)
+
+    # CRT recombination in the w*(u-v) + v form: one multiply, one reduction
+    x = (key.w * (r_p - r_q) + r_q) % key.n
+
+    # Canonical signature is the smaller root; compare via a one-limb shift
+    # and only materialize n - x when it actually is the smaller one
+    signature = key.n - x if x << 1 > key.n else x
+    return int(signature)
+
+def sign(message, key):
+    """Generate a Rabin signature."""
+    return _sign_hashed(hash_message(message) % key.n, key)
+
+def sign_many(messages, key):
+    """Sign a batch of messages with one shared key setup."""
+    return [_sign_hashed(hash_message(message) % key.n, key)
+            for message in messages]
+
+def verify(message, signature, n):
+    """Verify a Rabin signature."""
+    # Out-of-range signatures can never verify; reject before any arithmetic
+    if not 0 < signature < n:
+        return False
+    n = gmpy2.mpz(n)
+    m = hash_message(message) % n
+    # A plain square-and-reduce skips the exponentiation machinery entirely
+    s = gmpy2.mpz(signature)
+    check = s * s % n
+    # Check if either the signature or its negative (mod n) matches
+    return check == m or (n - check) == m